@@ -57,6 +57,26 @@ REASONING_EFFORT = os.getenv('REASONING_EFFORT', 'disabled')
 # Bypass tool consent for automated operation (no human in the loop)
 os.environ['BYPASS_TOOL_CONSENT'] = 'true'
 
+# Module-level ItemSyncModule shared across warm Lambda invocations so its
+# boto3 clients and in-process caches (sync marker, file contents, content
+# hashes) survive container reuse instead of being rebuilt per call.
+_sync_module = None
+
+
+def _get_sync_module():
+    """
+    Return the shared ItemSyncModule, creating it on first use.
+
+    Returns:
+        ItemSyncModule instance, or None if item_sync is unavailable
+    """
+    global _sync_module
+    if not ITEM_SYNC_AVAILABLE:
+        return None
+    if _sync_module is None:
+        _sync_module = ItemSyncModule(memory_id=MEMORY_ID or '', region=AWS_REGION)
+    return _sync_module
+
 
 def is_nova_2_model(model_id: str) -> bool:
     """Check if the model supports Nova 2 extended thinking."""
@@ -263,30 +283,21 @@ def _parse_memory_item_to_metadata(content: str):
         # Parse the stored format
         lines = content.strip().split('\n')
         
-        title = None
-        sb_id = None
-        item_type = None
-        path = None
-        tags = []
-        status = None
-        created_at = None
-        
+        # One partition per line instead of a startswith ladder: each line
+        # is scanned once and unknown keys fall through harmlessly.
+        fields = {}
         for line in lines:
-            if line.startswith('Item: '):
-                title = line[6:].strip()
-            elif line.startswith('ID: '):
-                sb_id = line[4:].strip()
-            elif line.startswith('Type: '):
-                item_type = line[6:].strip()
-            elif line.startswith('Path: '):
-                path = line[6:].strip()
-            elif line.startswith('Tags: '):
-                tags_str = line[6:].strip()
-                tags = [t.strip() for t in tags_str.split(',') if t.strip()]
-            elif line.startswith('Status: '):
-                status = line[8:].strip()
-            elif line.startswith('Created: '):
-                created_at = line[9:].strip()
+            key, sep, value = line.partition(': ')
+            if sep:
+                fields[key] = value.strip()
+        
+        title = fields.get('Item')
+        sb_id = fields.get('ID')
+        item_type = fields.get('Type')
+        path = fields.get('Path')
+        tags = [t.strip() for t in fields.get('Tags', '').split(',') if t.strip()]
+        status = fields.get('Status')
+        created_at = fields.get('Created')
         
         # Validate required fields
         if not all([title, sb_id, item_type, path]):
@@ -338,7 +349,7 @@ def read_items_from_codecommit() -> list:
         return []
     
     try:
-        sync_module = ItemSyncModule(memory_id=MEMORY_ID or '', region=AWS_REGION)
+        sync_module = _get_sync_module()
         head_commit = sync_module.get_codecommit_head()
         if not head_commit:
             return []
@@ -972,7 +983,7 @@ def ensure_memory_initialized(actor_id: str) -> bool:
         return False
     
     try:
-        sync_module = ItemSyncModule(memory_id=MEMORY_ID, region=AWS_REGION)
+        sync_module = _get_sync_module()
         
         # Always sync to ensure Memory is up to date
         result = sync_module.sync_items(actor_id)
@@ -1003,7 +1014,7 @@ def run_delta_sync(actor_id: str) -> None:
         return
     
     try:
-        sync_module = ItemSyncModule(memory_id=MEMORY_ID, region=AWS_REGION)
+        sync_module = _get_sync_module()
         result = sync_module.sync_items(actor_id)
         
         if result.success:
@@ -1062,8 +1073,8 @@ def handle_sync_operation(payload: dict) -> dict:
             "health_report": None,
         }
     
-    # Initialize sync module
-    sync_module = ItemSyncModule(memory_id=MEMORY_ID, region=AWS_REGION)
+    # Initialize sync module (shared across warm invocations)
+    sync_module = _get_sync_module()
     
     if operation == 'health_check':
         return _handle_health_check(sync_module, actor_id)
@@ -1247,13 +1258,19 @@ def _handle_repair(sync_module, actor_id: str, payload: dict) -> dict:
                 "health_report": None,
             }
         
-        # Get all item files and extract their metadata
+        # Get all item files
         all_files = sync_module._get_all_item_files(head_commit)
-        
-        # Build a map of sb_id -> metadata for all items
+
+        # The filename encodes the sb_id, so skip fetching content for items
+        # that are not in the missing set; only unparseable paths still need
+        # a fetch to establish their identity.
+        missing_set = set(missing_ids)
         items_by_id = {}
         for file_info in all_files:
             path = file_info['path']
+            parsed = sync_module._parse_path_metadata(path)
+            if parsed and parsed[1] not in missing_set:
+                continue
             content = sync_module.get_file_content(path, head_commit)
             if content:
                 metadata = sync_module.extract_item_metadata(path, content)
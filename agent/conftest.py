@@ -0,0 +1,77 @@
+"""
+Shared pytest configuration for the agent test suite.
+
+Registers Hypothesis settings profiles so example counts live in one
+place instead of per-test @settings decorators:
+
+- dev (default): small example counts and deterministic generation for
+  fast local iteration
+- ci: full example counts with a persistent example database so
+  falsifying examples found on earlier runs are replayed first
+
+Select with HYPOTHESIS_PROFILE, e.g. HYPOTHESIS_PROFILE=ci pytest.
+
+Useful invocations:
+    pytest -m "not property"                  fast unit-test smoke run
+    HYPOTHESIS_PROFILE=ci pytest -m property  thorough property run
+    pytest -p no:cacheprovider                skip .pytest_cache writes
+"""
+
+import os
+
+import pytest
+from hypothesis import Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+from item_sync import ItemSyncModule
+
+# deadline=None in both profiles: property bodies run mocked pure-Python
+# code, and wall-clock deadlines only add flaky reruns on slow runners.
+settings.register_profile(
+    'dev',
+    max_examples=20,
+    derandomize=True,
+    deadline=None,
+    # Skip the explain phase: attributing failures is worth less in the
+    # inner loop than getting back to red/green quickly.
+    phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink),
+    # No example-database writes in the inner loop; derandomized runs make
+    # replay mostly redundant and the ci profile keeps a persistent database.
+    database=None,
+)
+
+settings.register_profile(
+    'ci',
+    max_examples=100,
+    deadline=None,
+    database=DirectoryBasedExampleDatabase('.hypothesis/examples'),
+)
+
+settings.register_profile(
+    'nightly',
+    max_examples=1000,
+    deadline=None,
+    database=DirectoryBasedExampleDatabase('.hypothesis/examples'),
+)
+
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'dev'))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'property: hypothesis-driven property tests; deselect with -m "not property"',
+    )
+
+
+@pytest.fixture
+def sync_module():
+    """
+    Fresh ItemSyncModule per test.
+
+    Function-scoped on purpose: the instance carries caches (file
+    contents, parsed metadata, stored-content digests, last health
+    report) that must not leak between tests. Construction is cheap --
+    boto3 clients are created lazily, so no AWS setup happens here.
+    """
+    return ItemSyncModule(memory_id='test-memory', region='us-east-1')
@@ -10,7 +10,55 @@ Feature: memory-repo-sync, Property 8: Memory-first retrieval
 
 import pytest
 import re
-from hypothesis import given, strategies as st, settings
+from functools import lru_cache
+from types import MappingProxyType
+from hypothesis import given, strategies as st
+
+# Compiled once; \A/\Z anchor the whole string without MULTILINE ambiguity
+_SB_ID_RE = re.compile(r'\Asb-[a-f0-9]{7}\Z')
+
+_ITEM_TYPES = ('idea', 'decision', 'project')
+_FOLDERS = ('10-ideas', '20-decisions', '30-projects')
+
+
+# The eight meaningful availability combinations: Memory unavailable,
+# returning items, returning nothing, or failing -- each with and without
+# the CodeCommit fallback. Enumerating them replaces a composite of four
+# dependent boolean draws whose extra states were unreachable anyway.
+SCENARIOS = [
+    {
+        'memory_available': memory_available,
+        'memory_returns_items': memory_returns_items,
+        'memory_fails': memory_fails,
+        'codecommit_available': codecommit_available,
+    }
+    for memory_available, memory_returns_items, memory_fails in [
+        (False, False, False),  # Memory unavailable
+        (True, True, False),    # Memory returns items
+        (True, False, False),   # Memory available but empty
+        (True, False, True),    # Memory raises
+    ]
+    for codecommit_available in (False, True)
+]
+
+
+@lru_cache(maxsize=128)
+def _parse_memory_lines(content):
+    """
+    Parse memory-record text into a {field: value} mapping in one pass.
+
+    Mirrors the line handling of the classifier's
+    _parse_memory_item_to_metadata: one partition per line instead of
+    probing every known prefix with startswith. Cached because the unit
+    tests re-parse the same literals on every run; the read-only proxy
+    keeps the shared result safe to reuse.
+    """
+    fields = {}
+    for line in content.strip().split('\n'):
+        key, sep, value = line.partition(': ')
+        if sep:
+            fields[key] = value.strip()
+    return MappingProxyType(fields)
 
 
 class TestMemoryFirstRetrieval:
@@ -27,31 +75,7 @@ class TestMemoryFirstRetrieval:
     Feature: memory-repo-sync, Property 8: Memory-first retrieval
     """
     
-    @st.composite
-    def availability_scenario_strategy(draw):
-        """
-        Generate random availability scenarios for Memory and CodeCommit.
-        
-        Returns a dict with:
-        - memory_available: bool - whether Memory is available
-        - memory_returns_items: bool - whether Memory returns items (if available)
-        - memory_fails: bool - whether Memory raises an exception
-        - codecommit_available: bool - whether CodeCommit fallback is available
-        """
-        memory_available = draw(st.booleans())
-        memory_returns_items = draw(st.booleans()) if memory_available else False
-        memory_fails = draw(st.booleans()) if memory_available and not memory_returns_items else False
-        codecommit_available = draw(st.booleans())
-        
-        return {
-            'memory_available': memory_available,
-            'memory_returns_items': memory_returns_items,
-            'memory_fails': memory_fails,
-            'codecommit_available': codecommit_available,
-        }
-    
-    @given(availability_scenario_strategy())
-    @settings(max_examples=100)
+    @given(st.sampled_from(SCENARIOS))
     def test_memory_first_fallback_logic(self, scenario):
         """
         Property: Memory is tried first, with fallback to CodeCommit.
@@ -67,30 +91,17 @@ class TestMemoryFirstRetrieval:
         memory_fails = scenario['memory_fails']
         codecommit_available = scenario['codecommit_available']
         
-        # Track which source was used
-        memory_tried = False
-        codecommit_tried = False
-        result_items = []
-        
-        # Simulate Memory-first retrieval logic
-        try:
-            if memory_available:
-                memory_tried = True
-                if memory_fails:
-                    raise Exception("Memory failed")
-                if memory_returns_items:
-                    result_items = [{'sb_id': 'sb-0000001', 'title': 'Memory Item'}]
-        except Exception:
-            pass  # Memory failed, will fall back
+        # Simulate Memory-first retrieval with direct branching; raising and
+        # catching a throwaway exception per example only burned cycles
+        memory_tried = memory_available
+        memory_succeeded = memory_available and memory_returns_items and not memory_fails
+        result_items = [{'sb_id': 'sb-0000001', 'title': 'Memory Item'}] if memory_succeeded else []
         
         # Fallback to CodeCommit if Memory didn't return items
-        if not result_items:
-            try:
-                if codecommit_available:
-                    codecommit_tried = True
-                    result_items = [{'sb_id': 'sb-0000002', 'title': 'CodeCommit Item'}]
-            except Exception:
-                pass
+        codecommit_tried = False
+        if not result_items and codecommit_available:
+            codecommit_tried = True
+            result_items = [{'sb_id': 'sb-0000002', 'title': 'CodeCommit Item'}]
         
         # Verify the expected behavior
         if memory_available:
@@ -106,7 +117,6 @@ class TestMemoryFirstRetrieval:
                 "Should fall back to CodeCommit when Memory fails or returns empty"
     
     @given(st.lists(st.text(min_size=1, max_size=50, alphabet='abcdefghijklmnopqrstuvwxyz').filter(lambda x: x.strip()), min_size=0, max_size=5))
-    @settings(max_examples=100)
     def test_memory_items_parsing_preserves_data(self, titles):
         """
         Property: Memory item parsing preserves all data fields.
@@ -116,8 +126,8 @@ class TestMemoryFirstRetrieval:
         # Generate memory content for each title
         for i, title in enumerate(titles):
             sb_id = f"sb-{i:07x}"
-            item_type = ['idea', 'decision', 'project'][i % 3]
-            folder = ['10-ideas', '20-decisions', '30-projects'][i % 3]
+            item_type = _ITEM_TYPES[i % 3]
+            folder = _FOLDERS[i % 3]
             
             content = f"""Item: {title}
 ID: {sb_id}
@@ -125,21 +135,11 @@ Type: {item_type}
 Path: {folder}/test__{sb_id}.md"""
             
             # Parse the content using the same logic as _parse_memory_item_to_metadata
-            lines = content.strip().split('\n')
-            parsed_title = None
-            parsed_sb_id = None
-            parsed_type = None
-            parsed_path = None
-            
-            for line in lines:
-                if line.startswith('Item: '):
-                    parsed_title = line[6:].strip()
-                elif line.startswith('ID: '):
-                    parsed_sb_id = line[4:].strip()
-                elif line.startswith('Type: '):
-                    parsed_type = line[6:].strip()
-                elif line.startswith('Path: '):
-                    parsed_path = line[6:].strip()
+            fields = _parse_memory_lines(content)
+            parsed_title = fields.get('Item')
+            parsed_sb_id = fields.get('ID')
+            parsed_type = fields.get('Type')
+            parsed_path = fields.get('Path')
             
             # Verify all fields are preserved (after stripping whitespace)
             assert parsed_title == title.strip(), f"Title should be preserved: {title}"
@@ -152,7 +152,6 @@ Path: {folder}/test__{sb_id}.md"""
         'Sync Marker\nCommit: abc1234',
         'Some random text without item format',
     ]))
-    @settings(max_examples=50)
     def test_non_item_content_is_skipped(self, content):
         """
         Property: Non-item content (sync markers, etc.) is skipped.
@@ -163,24 +162,14 @@ Path: {folder}/test__{sb_id}.md"""
         is_sync_marker = 'Last synced commit:' in content or 'Sync Marker' in content
         
         # Parse the content
-        lines = content.strip().split('\n')
-        title = None
-        sb_id = None
-        item_type = None
-        path = None
-        
-        for line in lines:
-            if line.startswith('Item: '):
-                title = line[6:].strip()
-            elif line.startswith('ID: '):
-                sb_id = line[4:].strip()
-            elif line.startswith('Type: '):
-                item_type = line[6:].strip()
-            elif line.startswith('Path: '):
-                path = line[6:].strip()
+        fields = _parse_memory_lines(content)
+        title = fields.get('Item')
+        sb_id = fields.get('ID')
+        item_type = fields.get('Type')
+        path = fields.get('Path')
         
         # Validate sb_id format if present
-        valid_sb_id = sb_id and re.match(r'^sb-[a-f0-9]{7}$', sb_id)
+        valid_sb_id = sb_id and _SB_ID_RE.match(sb_id)
         
         # Check if this would be a valid item
         is_valid_item = all([title, valid_sb_id, item_type, path]) and not is_sync_marker
@@ -284,28 +273,13 @@ Tags: home, outdoor, landscaping
 Status: active"""
         
         # Parse using the same logic
-        lines = content.strip().split('\n')
-        title = None
-        sb_id = None
-        item_type = None
-        path = None
-        tags = []
-        status = None
-        
-        for line in lines:
-            if line.startswith('Item: '):
-                title = line[6:].strip()
-            elif line.startswith('ID: '):
-                sb_id = line[4:].strip()
-            elif line.startswith('Type: '):
-                item_type = line[6:].strip()
-            elif line.startswith('Path: '):
-                path = line[6:].strip()
-            elif line.startswith('Tags: '):
-                tags_str = line[6:].strip()
-                tags = [t.strip() for t in tags_str.split(',') if t.strip()]
-            elif line.startswith('Status: '):
-                status = line[8:].strip()
+        fields = _parse_memory_lines(content)
+        title = fields.get('Item')
+        sb_id = fields.get('ID')
+        item_type = fields.get('Type')
+        path = fields.get('Path')
+        tags = [t.strip() for t in fields.get('Tags', '').split(',') if t.strip()]
+        status = fields.get('Status')
         
         assert title == 'Home Landscaping Project'
         assert sb_id == 'sb-1234567'
@@ -321,28 +295,13 @@ ID: sb-abcdef0
 Type: idea
 Path: 10-ideas/simple.md"""
         
-        lines = content.strip().split('\n')
-        title = None
-        sb_id = None
-        item_type = None
-        path = None
-        tags = []
-        status = None
-        
-        for line in lines:
-            if line.startswith('Item: '):
-                title = line[6:].strip()
-            elif line.startswith('ID: '):
-                sb_id = line[4:].strip()
-            elif line.startswith('Type: '):
-                item_type = line[6:].strip()
-            elif line.startswith('Path: '):
-                path = line[6:].strip()
-            elif line.startswith('Tags: '):
-                tags_str = line[6:].strip()
-                tags = [t.strip() for t in tags_str.split(',') if t.strip()]
-            elif line.startswith('Status: '):
-                status = line[8:].strip()
+        fields = _parse_memory_lines(content)
+        title = fields.get('Item')
+        sb_id = fields.get('ID')
+        item_type = fields.get('Type')
+        path = fields.get('Path')
+        tags = [t.strip() for t in fields.get('Tags', '').split(',') if t.strip()]
+        status = fields.get('Status')
         
         assert title == 'Simple Idea'
         assert sb_id == 'sb-abcdef0'
@@ -365,7 +324,7 @@ Path: 10-ideas/simple.md"""
         invalid_ids = ['invalid', 'sb-123', 'sb-12345678', 'SB-1234567', 'sb-ABCDEFG']
         
         for sb_id in invalid_ids:
-            is_valid = bool(re.match(r'^sb-[a-f0-9]{7}$', sb_id))
+            is_valid = bool(_SB_ID_RE.match(sb_id))
             assert not is_valid, f"Should reject invalid sb_id: {sb_id}"
     
     def test_accepts_valid_sb_id(self):
@@ -373,7 +332,7 @@ Path: 10-ideas/simple.md"""
         valid_ids = ['sb-0000000', 'sb-1234567', 'sb-abcdef0', 'sb-a1b2c3d']
         
         for sb_id in valid_ids:
-            is_valid = bool(re.match(r'^sb-[a-f0-9]{7}$', sb_id))
+            is_valid = bool(_SB_ID_RE.match(sb_id))
             assert is_valid, f"Should accept valid sb_id: {sb_id}"
 
 
@@ -18,6 +18,10 @@ MEMORY_ID = os.getenv('MEMORY_ID')
 REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
 TEST_ACTOR_ID = 'test-user-integration'
 
+# batch_create_memory_records accepts up to 25 records per call; one full
+# batch amortizes the HTTPS round-trip across all of them.
+BATCH_SIZE = 25
+
 def get_memory_id_from_cdk():
     """Try to get Memory ID from CDK outputs."""
     try:
@@ -36,8 +40,8 @@ def get_memory_id_from_cdk():
     return None
 
 
-def test_batch_create_memory_records():
-    """Test storing an item using BatchCreateMemoryRecords API via SDK."""
+def test_batch_create_memory_records(n_records=BATCH_SIZE):
+    """Test storing a full batch of items in one BatchCreateMemoryRecords call."""
     print("\n=== Test: BatchCreateMemoryRecords (via SDK) ===")
     
     try:
@@ -47,16 +51,26 @@ def test_batch_create_memory_records():
         print("Install with: pip install 'bedrock-agentcore[strands-agents]>=1.2.0'")
         return False
     
-    # Create a test item
-    test_sb_id = f"sb-test{datetime.now().strftime('%H%M%S')}"
-    test_content = f"""Item: Integration Test Item
+    # Create a batch of test items; one API call covers all of them
+    stamp = datetime.now().strftime('%H%M%S')
+    timestamp = datetime.now(timezone.utc)  # Required by API
+    records = []
+    for i in range(n_records):
+        test_sb_id = f"sb-test{stamp}-{i:02d}"
+        test_content = f"""Item: Integration Test Item {i}
 ID: {test_sb_id}
 Type: idea
-Path: 10-ideas/test-item.md
+Path: 10-ideas/test-item-{i}.md
 Tags: test, integration
 """
-    
-    print(f"Storing test item: {test_sb_id}")
+        records.append({
+            'requestIdentifier': test_sb_id,
+            'namespaces': [f'/items/{TEST_ACTOR_ID}'],
+            'content': {'text': test_content},
+            'timestamp': timestamp,
+        })
+    
+    print(f"Storing {len(records)} test items in one batch")
     print(f"Memory ID: {MEMORY_ID}")
     print(f"Namespace: /items/{TEST_ACTOR_ID}")
     
@@ -67,27 +81,22 @@ Tags: test, integration
         # Access the underlying boto3 data plane client via gmdp_client
         response = client.gmdp_client.batch_create_memory_records(
             memoryId=MEMORY_ID,
-            records=[{
-                'requestIdentifier': test_sb_id,
-                'namespaces': [f'/items/{TEST_ACTOR_ID}'],
-                'content': {'text': test_content},
-                'timestamp': datetime.now(timezone.utc),  # Required by API
-            }]
+            records=records,
         )
         
         successful = response.get('successfulRecords', [])
         failed = response.get('failedRecords', [])
         
         if failed:
-            print(f"❌ FAILED: {failed[0].get('errorMessage', 'Unknown error')}")
+            print(f"❌ FAILED: {len(failed)} records failed, "
+                  f"first error: {failed[0].get('errorMessage', 'Unknown error')}")
             return False
         
-        if successful:
-            record_id = successful[0].get('memoryRecordId', 'unknown')
-            print(f"✓ SUCCESS: Created record {record_id}")
+        if len(successful) == len(records):
+            print(f"✓ SUCCESS: Created {len(successful)} records in one call")
             return True
         
-        print("❌ FAILED: No records in response")
+        print(f"❌ FAILED: Expected {len(records)} records, got {len(successful)}")
         return False
         
     except Exception as e: